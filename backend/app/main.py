@@ -22,7 +22,12 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
-from app.services.query_orchestrator import execute_query as run_pipeline, PipelineStage
+from app.services.query_orchestrator import (
+    execute_query as run_pipeline,
+    PipelineStage,
+    shutdown as shutdown_pipeline,
+    warmup as warmup_pipeline,
+)
 from app.services.catalog_manager import CatalogManager
 
 # Load environment variables
@@ -69,12 +74,16 @@ async def lifespan(app: FastAPI):
     logger.info(f"Loading catalog from: {CATALOG_PATH}")
     app_state.catalog = CatalogManager(str(CATALOG_PATH))
     
+    # Create the pipeline's catalog and API clients before the first request
+    warmup_pipeline()
+    
     logger.info("NL2SQL API started successfully")
     
     yield
     
     # Shutdown
     logger.info("Shutting down NL2SQL API...")
+    shutdown_pipeline()
 
 
 # =============================================================================
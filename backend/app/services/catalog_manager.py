@@ -15,11 +15,20 @@ Future considerations:
 - `storage_id`: For caching / persistence layer
 """
 
+import copy
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 import yaml
 
+try:
+    # libyaml-backed loader; several times faster than the pure-Python one
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
 
 class CatalogError(Exception):
     """Exception raised for catalog-related errors."""
@@ -40,6 +49,22 @@ class AmbiguousResolutionError(CatalogError):
         )
 
 
+@lru_cache(maxsize=8)
+def _parse_catalog_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parse a catalog YAML file.
+    
+    Cached per (path, mtime) so building several CatalogManagers from the
+    same unchanged file parses it once. Editing the file changes its mtime
+    and forces a re-parse. The cached dict is never handed out: callers
+    take a deep copy, which is several times cheaper than re-parsing.
+    """
+    # Binary handle: the loader detects the encoding and reads in chunks itself
+    with open(path, 'rb') as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return data or {}
+
+
 @dataclass
 class ResolutionResult:
     """Result of a catalog resolution, including ambiguity info."""
@@ -83,10 +108,13 @@ class CatalogManager:
         self._catalog = self._load_catalog()
         self._build_indexes()
 
-    def _load_catalog(self) -> Dict:
+    def _load_catalog(self) -> Dict[str, Any]:
         """Load and validate the catalog YAML file."""
-        with open(self.catalog_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+        stat = self.catalog_path.stat()
+        # Own copy per instance, so no two managers share mutable catalog data
+        data = copy.deepcopy(
+            _parse_catalog_file(str(self.catalog_path.resolve()), stat.st_mtime_ns)
+        )
 
         required_sections = {'metrics', 'dimensions', 'time_dimensions'}
         missing_sections = required_sections - set(data.keys())
@@ -128,7 +156,7 @@ class CatalogManager:
             metric_name = metric.get('name', '')
             
             # ID should be unique - direct mapping
-            self._metric_by_id[metric_id.lower()] = metric
+            self._metric_by_id[sys.intern(metric_id.lower())] = metric
             
             # Names/aliases map to lists for ambiguity detection
             self._add_to_list_index(self._metric_by_name, metric_name.lower(), metric)
@@ -150,7 +178,7 @@ class CatalogManager:
             dim_id = dimension.get('id', '')
             dim_name = dimension.get('name', '')
             
-            self._dimension_by_id[dim_id.lower()] = dimension
+            self._dimension_by_id[sys.intern(dim_id.lower())] = dimension
             
             self._add_to_list_index(self._dimension_by_name, dim_name.lower(), dimension)
             self._track_cross_type(dim_name.lower(), 'dimension')
@@ -169,7 +197,7 @@ class CatalogManager:
             td_id = time_dim.get('id', '')
             td_name = time_dim.get('name', '')
             
-            self._time_dimension_by_id[td_id.lower()] = time_dim
+            self._time_dimension_by_id[sys.intern(td_id.lower())] = time_dim
             
             self._add_to_list_index(self._time_dimension_by_name, td_name.lower(), time_dim)
             self._track_cross_type(td_name.lower(), 'time_dimension')
@@ -189,9 +217,56 @@ class CatalogManager:
             
             for alias in tw.get('aliases', []):
                 self._add_to_list_index(self._time_window_by_name, alias.lower(), tw)
+        
+        # Combined lowercase lookups used by find_*: an ID match takes precedence
+        # over name/alias matches, so a single dict get answers every lookup
+        self._metric_lookup = self._merge_lookup(self._metric_by_name, self._metric_by_id)
+        self._dimension_lookup = self._merge_lookup(self._dimension_by_name, self._dimension_by_id)
+        self._time_dimension_lookup = self._merge_lookup(
+            self._time_dimension_by_name, self._time_dimension_by_id
+        )
+        
+        # Search index: (item, lowercased searchable text) pairs, built once so
+        # search_* does a single substring scan per item
+        self._metric_search_index = [
+            (m, self._search_text(m)) for m in self._catalog.get('metrics', [])
+        ]
+        self._dimension_search_index = [
+            (d, self._search_text(d)) for d in self._catalog.get('dimensions', [])
+        ]
+
+    @staticmethod
+    def _search_text(item: Dict) -> str:
+        """
+        Join an item's name, display_name, description, aliases and examples
+        into one lowercased string.
+        
+        Fields are separated by NUL so a search term cannot match across two
+        fields.
+        """
+        fields = [
+            item.get('name', ''),
+            item.get('display_name', ''),
+            item.get('description', ''),
+            *item.get('aliases', []),
+            *item.get('examples', []),
+        ]
+        return '\0'.join(fields).lower()
+
+    @staticmethod
+    def _merge_lookup(
+        by_name: Dict[str, List[Dict]], by_id: Dict[str, Dict]
+    ) -> Dict[str, List[Dict]]:
+        """Merge a name index and an ID index into one lookup (IDs win)."""
+        lookup = dict(by_name)
+        for key, item in by_id.items():
+            lookup[key] = [item]
+        return lookup
 
     def _add_to_list_index(self, index: Dict[str, List[Dict]], key: str, item: Dict) -> None:
         """Add item to a list-based index, avoiding duplicates."""
+        # Index keys are shared across several indexes; intern them once
+        key = sys.intern(key)
         if key not in index:
             index[key] = []
         # Avoid adding the same item twice (by id)
@@ -201,6 +276,7 @@ class CatalogManager:
 
     def _track_cross_type(self, term: str, item_type: str) -> None:
         """Track which types a term appears in for cross-type collision detection."""
+        term = sys.intern(term)
         if term not in self._cross_type_index:
             self._cross_type_index[term] = set()
         self._cross_type_index[term].add(item_type)
@@ -278,87 +354,53 @@ class CatalogManager:
         """
         Find all metrics matching a term (name, alias, or ID).
         Returns empty list if no matches. Never raises.
-        """
-        key = term.lower()
-        
-        # Check by ID first (unique)
-        if key in self._metric_by_id:
-            return [self._metric_by_id[key]]
         
-        # Check by name/alias (may be multiple)
-        return self._metric_by_name.get(key, [])
+        find_* return a new list each time, so callers can't alter the index.
+        """
+        return list(self._metric_lookup.get(term.lower(), ()))
 
     def find_dimensions(self, term: str) -> List[Dict]:
         """Find all dimensions matching a term. Returns empty list if no matches."""
-        key = term.lower()
-        
-        if key in self._dimension_by_id:
-            return [self._dimension_by_id[key]]
-        
-        return self._dimension_by_name.get(key, [])
+        return list(self._dimension_lookup.get(term.lower(), ()))
 
     def find_time_dimensions(self, term: str) -> List[Dict]:
         """Find all time dimensions matching a term."""
-        key = term.lower()
-        
-        if key in self._time_dimension_by_id:
-            return [self._time_dimension_by_id[key]]
-        
-        return self._time_dimension_by_name.get(key, [])
+        return list(self._time_dimension_lookup.get(term.lower(), ()))
 
     def find_time_windows(self, term: str) -> List[Dict]:
         """Find all time windows matching a term."""
-        key = term.lower()
-        return self._time_window_by_name.get(key, [])
+        return list(self._time_window_by_name.get(term.lower(), ()))
 
     # --------------- PUBLIC API: Safe Resolve Methods (returns ResolutionResult) ---------------
 
+    @staticmethod
+    def _resolution(matches: List[Dict], item_type: str) -> ResolutionResult:
+        """Build a ResolutionResult from the matches a find_* method returned."""
+        if len(matches) == 0:
+            return ResolutionResult(None, False, [], item_type)
+        elif len(matches) == 1:
+            return ResolutionResult(matches[0], False, matches, item_type)
+        else:
+            return ResolutionResult(None, True, matches, item_type)
+
     def resolve_metric_safe(self, name: str) -> ResolutionResult:
         """
         Safely resolve a metric, returning a ResolutionResult with ambiguity info.
         Does not raise on ambiguity - caller can decide how to handle.
         """
-        matches = self.find_metrics(name)
-        
-        if len(matches) == 0:
-            return ResolutionResult(None, False, [], 'metric')
-        elif len(matches) == 1:
-            return ResolutionResult(matches[0], False, matches, 'metric')
-        else:
-            return ResolutionResult(None, True, matches, 'metric')
+        return self._resolution(self.find_metrics(name), 'metric')
 
     def resolve_dimension_safe(self, name: str) -> ResolutionResult:
         """Safely resolve a dimension, returning ResolutionResult with ambiguity info."""
-        matches = self.find_dimensions(name)
-        
-        if len(matches) == 0:
-            return ResolutionResult(None, False, [], 'dimension')
-        elif len(matches) == 1:
-            return ResolutionResult(matches[0], False, matches, 'dimension')
-        else:
-            return ResolutionResult(None, True, matches, 'dimension')
+        return self._resolution(self.find_dimensions(name), 'dimension')
 
     def resolve_time_dimension_safe(self, name: str) -> ResolutionResult:
         """Safely resolve a time dimension."""
-        matches = self.find_time_dimensions(name)
-        
-        if len(matches) == 0:
-            return ResolutionResult(None, False, [], 'time_dimension')
-        elif len(matches) == 1:
-            return ResolutionResult(matches[0], False, matches, 'time_dimension')
-        else:
-            return ResolutionResult(None, True, matches, 'time_dimension')
+        return self._resolution(self.find_time_dimensions(name), 'time_dimension')
 
     def resolve_time_window_safe(self, name: str) -> ResolutionResult:
         """Safely resolve a time window."""
-        matches = self.find_time_windows(name)
-        
-        if len(matches) == 0:
-            return ResolutionResult(None, False, [], 'time_window')
-        elif len(matches) == 1:
-            return ResolutionResult(matches[0], False, matches, 'time_window')
-        else:
-            return ResolutionResult(None, True, matches, 'time_window')
+        return self._resolution(self.find_time_windows(name), 'time_window')
 
     # --------------- PUBLIC API: Strict Resolve Methods (raises on ambiguity) ---------------
 
@@ -499,19 +541,19 @@ class CatalogManager:
 
     def is_valid_metric(self, name: str) -> bool:
         """Check if a metric name/alias exists in the catalog."""
-        return len(self.find_metrics(name)) > 0
+        return name.lower() in self._metric_lookup
 
     def is_valid_dimension(self, name: str) -> bool:
         """Check if a dimension name/alias exists in the catalog."""
-        return len(self.find_dimensions(name)) > 0
+        return name.lower() in self._dimension_lookup
 
     def is_valid_time_dimension(self, name: str) -> bool:
         """Check if a time dimension name/ID exists in the catalog."""
-        return len(self.find_time_dimensions(name)) > 0
+        return name.lower() in self._time_dimension_lookup
 
     def is_valid_time_window(self, name: str) -> bool:
         """Check if a time window name/ID/alias exists in the catalog."""
-        return len(self.find_time_windows(name)) > 0
+        return name.lower() in self._time_window_by_name
 
     def is_unambiguous_metric(self, name: str) -> bool:
         """Check if a term resolves to exactly one metric."""
@@ -549,87 +591,63 @@ class CatalogManager:
         Search metrics by name, alias, description, or examples.
         """
         query_lower = query.lower()
-        results = []
-        
-        for metric in self._catalog.get('metrics', []):
-            if query_lower in metric.get('name', '').lower():
-                results.append(metric)
-                continue
-            if query_lower in metric.get('display_name', '').lower():
-                results.append(metric)
-                continue
-            if query_lower in metric.get('description', '').lower():
-                results.append(metric)
-                continue
-            if any(query_lower in alias.lower() for alias in metric.get('aliases', [])):
-                results.append(metric)
-                continue
-            if any(query_lower in ex.lower() for ex in metric.get('examples', [])):
-                results.append(metric)
-                continue
-        
-        return results
+        return [m for m, text in self._metric_search_index if query_lower in text]
 
     def search_dimensions(self, query: str) -> List[Dict]:
         """
         Search dimensions by name, alias, description, or examples.
         """
         query_lower = query.lower()
-        results = []
-        
-        for dimension in self._catalog.get('dimensions', []):
-            if query_lower in dimension.get('name', '').lower():
-                results.append(dimension)
-                continue
-            if query_lower in dimension.get('display_name', '').lower():
-                results.append(dimension)
-                continue
-            if query_lower in dimension.get('description', '').lower():
-                results.append(dimension)
-                continue
-            if any(query_lower in alias.lower() for alias in dimension.get('aliases', [])):
-                results.append(dimension)
-                continue
-            if any(query_lower in ex.lower() for ex in dimension.get('examples', [])):
-                results.append(dimension)
-                continue
-        
-        return results
+        return [d for d, text in self._dimension_search_index if query_lower in text]
+
+    def has_metric_matching(self, query: str) -> bool:
+        """Check if any metric matches a search term. Stops at the first match."""
+        query_lower = query.lower()
+        return any(query_lower in text for _, text in self._metric_search_index)
+
+    def has_dimension_matching(self, query: str) -> bool:
+        """Check if any dimension matches a search term. Stops at the first match."""
+        query_lower = query.lower()
+        return any(query_lower in text for _, text in self._dimension_search_index)
 
     # --------------- PUBLIC API: Priority/Ranking Methods ---------------
 
+    def iter_high_priority_metrics(self) -> Iterator[Dict]:
+        """Yield metrics marked as high priority (lazy form of get_high_priority_metrics)."""
+        return (m for m in self._catalog.get('metrics', []) if m.get('priority') == 'high')
+
+    def iter_high_priority_dimensions(self) -> Iterator[Dict]:
+        """Yield dimensions marked as high priority."""
+        return (d for d in self._catalog.get('dimensions', []) if d.get('priority') == 'high')
+
+    def iter_filterable_dimensions(self) -> Iterator[Dict]:
+        """Yield dimensions that can be used for filtering."""
+        return (d for d in self._catalog.get('dimensions', []) if d.get('filterable', False))
+
+    def iter_groupable_dimensions(self) -> Iterator[Dict]:
+        """Yield dimensions that can be used for grouping."""
+        return (d for d in self._catalog.get('dimensions', []) if d.get('groupable', False))
+
     def get_high_priority_metrics(self) -> List[Dict]:
         """Return metrics marked as high priority."""
-        return [
-            m for m in self._catalog.get('metrics', [])
-            if m.get('priority') == 'high'
-        ]
+        return list(self.iter_high_priority_metrics())
 
     def get_high_priority_dimensions(self) -> List[Dict]:
         """Return dimensions marked as high priority."""
-        return [
-            d for d in self._catalog.get('dimensions', [])
-            if d.get('priority') == 'high'
-        ]
+        return list(self.iter_high_priority_dimensions())
 
     def get_filterable_dimensions(self) -> List[Dict]:
         """Return dimensions that can be used for filtering."""
-        return [
-            d for d in self._catalog.get('dimensions', [])
-            if d.get('filterable', False)
-        ]
+        return list(self.iter_filterable_dimensions())
 
     def get_groupable_dimensions(self) -> List[Dict]:
         """Return dimensions that can be used for grouping."""
-        return [
-            d for d in self._catalog.get('dimensions', [])
-            if d.get('groupable', False)
-        ]
+        return list(self.iter_groupable_dimensions())
 
     # --------------- Raw Access ---------------
 
-    def raw_catalog(self) -> Dict:
-        """Return the raw catalog dictionary."""
+    def raw_catalog(self) -> Dict[str, Any]:
+        """Return the raw catalog dictionary (owned by this instance)."""
         return self._catalog
 
     def get_section(self, section_name: str) -> Any:
@@ -137,9 +137,12 @@ class CubeClient:
     - Business logic
     
     Usage:
-        client = CubeClient()
-        response = client.load(query_json)
-        print(response.data)
+        with CubeClient() as client:
+            response = client.load(query_json)
+            print(response.data)
+    
+    The client holds a connection pool; close() it (or use it as a context
+    manager) unless it lives for the whole process.
     """
     
     def __init__(
@@ -162,6 +165,19 @@ class CubeClient:
         self.api_secret = api_secret or CUBE_API_SECRET
         self.timeout = timeout or REQUEST_TIMEOUT_SECONDS
         self.max_rows = max_rows or MAX_ROWS_LIMIT
+        # One connection pool per client, so repeated loads reuse keep-alive
+        # connections instead of reconnecting (and re-handshaking) each time
+        self._http = httpx.Client(timeout=self.timeout)
+    
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._http.close()
+    
+    def __enter__(self) -> "CubeClient":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
     
     def _generate_request_id(self) -> str:
         """Generate unique request ID for tracing."""
@@ -257,12 +273,11 @@ class CubeClient:
     ) -> CubeResponse:
         """Execute HTTP request to Cube."""
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.post(
-                    url,
-                    json={"query": query},
-                    headers=headers,
-                )
+            response = self._http.post(
+                url,
+                json={"query": query},
+                headers=headers,
+            )
         except httpx.ConnectError as e:
             raise CubeConnectionError(f"Cannot connect to Cube at {url}: {e}") from e
         except httpx.TimeoutException as e:
@@ -303,7 +318,7 @@ def execute_cube_query(query: dict[str, Any]) -> CubeResponse:
     """
     Convenience function to execute a Cube query.
     
-    Creates a CubeClient and executes the query.
+    Creates a CubeClient, executes the query and closes the client.
     
     Args:
         query: Cube query JSON
@@ -316,5 +331,5 @@ def execute_cube_query(query: dict[str, Any]) -> CubeResponse:
         >>> response = execute_cube_query(query)
         >>> print(response.data)
     """
-    client = CubeClient()
-    return client.load(query)
+    with CubeClient() as client:
+        return client.load(query)
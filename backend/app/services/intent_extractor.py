@@ -29,13 +29,18 @@ import hashlib
 import json
 import logging
 import os
+import re
 import sqlite3
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from dotenv import load_dotenv
-import anthropic
+
+# anthropic takes about a second to import; it is loaded on the first LLM
+# call so importing this module (e.g. for its exceptions) stays cheap
+if TYPE_CHECKING:
+    import anthropic
 
 # Load environment variables from .env file
 load_dotenv()
@@ -113,17 +118,38 @@ def _compute_prompt_hash(prompt: str) -> str:
     return hashlib.sha256(prompt.encode()).hexdigest()[:12]
 
 
-def _build_prompt(query: str, catalog: str, template: str) -> str:
+def _build_prompt(query: str, catalog: str, template: str) -> list[dict[str, Any]]:
     """
     Inject runtime values into prompt template.
     
-    No conditional logic. No mutations. Pure string substitution.
+    No conditional logic on content. No mutations. Pure string substitution.
     Uses simple string replacement instead of .format() to avoid
     conflicts with JSON curly braces in the template.
+    
+    Returns the prompt as user content blocks: everything before {query}
+    (instructions + catalog) is identical for every request and is marked
+    for Anthropic prompt caching, so only the query tail is re-processed.
+    Joining the block texts gives the full prompt.
     """
-    result = template.replace("{catalog}", catalog)
-    result = result.replace("{query}", query)
-    return result
+    head, marker, tail = template.partition("{query}")
+    blocks: list[dict[str, Any]] = [{
+        "type": "text",
+        "text": head.replace("{catalog}", catalog),
+        "cache_control": {"type": "ephemeral"},
+    }]
+    dynamic = query + tail if marker else ""
+    if dynamic.strip():
+        blocks.append({"type": "text", "text": dynamic})
+    else:
+        # The API rejects empty/whitespace-only text blocks; keep any
+        # trailing whitespace on the first block so the full prompt is unchanged
+        blocks[0]["text"] += dynamic
+    return blocks
+
+
+# Opening fence line (```json) and optional closing fence (```) of a
+# markdown code block wrapped around the JSON payload
+_CODE_FENCE_RE = re.compile(r"```[^\n]*\n(.*?)(?:\n[ \t]*```)?", re.DOTALL)
 
 
 def _parse_json_response(raw_response: str) -> dict[str, Any]:
@@ -139,14 +165,9 @@ def _parse_json_response(raw_response: str) -> dict[str, Any]:
     text = raw_response.strip()
     
     # Strip markdown code blocks if present
-    if text.startswith("```"):
-        lines = text.split("\n")
-        # Remove first line (```json) and last line (```)
-        if lines[-1].strip() == "```":
-            lines = lines[1:-1]
-        else:
-            lines = lines[1:]
-        text = "\n".join(lines).strip()
+    fenced = _CODE_FENCE_RE.fullmatch(text)
+    if fenced:
+        text = fenced.group(1).strip()
     
     try:
         parsed = json.loads(text)
@@ -159,7 +180,35 @@ def _parse_json_response(raw_response: str) -> dict[str, Any]:
     return parsed
 
 
-def _call_llm(prompt: str, *, retry_once: bool = True) -> str:
+# =============================================================================
+# CLIENT SINGLETON (Created once)
+# =============================================================================
+
+_client: "anthropic.Anthropic | None" = None
+
+def _get_client() -> "anthropic.Anthropic":
+    """
+    Get or initialize the Anthropic client.
+    
+    The client is created once and reused so its HTTP connection pool
+    (and the TLS session to the API) survives across extractions.
+    """
+    # Binds the module-level name too, for _call_llm's except clauses
+    global _client, anthropic
+    if _client is None:
+        import anthropic
+        _client = anthropic.Anthropic(
+            api_key=os.getenv("ANTHROPIC_API_KEY"),
+            timeout=TIMEOUT_SECONDS)
+    return _client
+
+
+def warmup() -> None:
+    """Create the Anthropic client (and import anthropic) ahead of the first extraction."""
+    _get_client()
+
+
+def _call_llm(prompt: list[dict[str, Any]], *, retry_once: bool = True) -> str:
     """
     Call LLM with explicit configuration.
     
@@ -172,9 +221,7 @@ def _call_llm(prompt: str, *, retry_once: bool = True) -> str:
         LLMTimeoutError: Request timed out
         EmptyResponseError: Empty response received
     """
-    client = anthropic.Anthropic(
-        api_key=os.getenv("ANTHROPIC_API_KEY"),
-        timeout=TIMEOUT_SECONDS)
+    client = _get_client()  # also imports anthropic
     
     attempt = 0
     max_attempts = 2 if retry_once else 1
@@ -192,6 +239,13 @@ def _call_llm(prompt: str, *, retry_once: bool = True) -> str:
                 ]
             )
             
+            logger.debug(
+                "Prompt cache: %s tokens read, %s tokens written",
+                # Not present on older SDK versions
+                getattr(response.usage, "cache_read_input_tokens", None),
+                getattr(response.usage, "cache_creation_input_tokens", None),
+            )
+            
             # Extract text content
             if not response.content:
                 raise EmptyResponseError("LLM returned empty content array")
@@ -314,7 +368,7 @@ def extract_intent(query: str) -> dict[str, Any]:
     """
     Extract intent from natural language query.
     
-    This is the ONLY public function in this module.
+    This is the ONLY extraction entry point in this module.
     
     Args:
         query: Natural language user query
@@ -344,7 +398,7 @@ def extract_intent(query: str) -> dict[str, Any]:
         
         # Build prompt (pure substitution, no logic)
         prompt = _build_prompt(query=query, catalog=catalog, template=template)
-        prompt_hash = _compute_prompt_hash(prompt)
+        prompt_hash = _compute_prompt_hash("".join(block["text"] for block in prompt))
         
         # Log raw input
         logger.info(
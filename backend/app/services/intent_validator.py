@@ -50,7 +50,7 @@ class IntentValidator:
         intent = validator.validate(raw_intent_dict)  # raises on failure
     """
     
-    VALID_GRANULARITIES = {"day", "week", "month", "quarter", "year"}
+    VALID_GRANULARITIES = frozenset({"day", "week", "month", "quarter", "year"})
     
     def __init__(self, catalog: CatalogManager):
         """
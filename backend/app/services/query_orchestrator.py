@@ -35,6 +35,7 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from pathlib import Path
 
+from app.services import intent_extractor
 from app.services.intent_extractor import (
     extract_intent,
     ExtractionError,
@@ -168,6 +169,52 @@ def _get_catalog() -> CatalogManager:
     return _catalog
 
 
+# =============================================================================
+# CUBE CLIENT SINGLETON (Created once)
+# =============================================================================
+
+_cube_client: Optional[CubeClient] = None
+
+def _get_cube_client() -> CubeClient:
+    """
+    Get or initialize the Cube client.
+    
+    Client is created once so its connection pool is shared across queries.
+    """
+    global _cube_client
+    if _cube_client is None:
+        _cube_client = CubeClient()
+    return _cube_client
+
+
+# =============================================================================
+# WARM-UP / SHUTDOWN
+# =============================================================================
+
+def warmup() -> None:
+    """
+    Load the catalog and create the Anthropic and Cube clients ahead of time.
+    
+    Called from the API's startup (and once per E2E test session) so the
+    one-time setup cost is paid up front instead of inside the first query.
+    """
+    _get_catalog()
+    intent_extractor.warmup()
+    _get_cube_client()
+
+
+def shutdown() -> None:
+    """
+    Close the shared Cube client's connection pool.
+    
+    Called from the API's shutdown; the next query creates a fresh client.
+    """
+    global _cube_client
+    if _cube_client is not None:
+        _cube_client.close()
+        _cube_client = None
+
+
 # =============================================================================
 # ORCHESTRATOR - THE MAIN FUNCTION
 # =============================================================================
@@ -176,7 +223,7 @@ def execute_query(query: str) -> OrchestratorResponse:
     """
     Execute a natural language query through the complete pipeline.
     
-    This is the ONLY public function in this module.
+    This is the ONLY pipeline entry point in this module.
     
     Pipeline steps:
     1. Receive query (no preprocessing)
@@ -347,7 +394,7 @@ def execute_query(query: str) -> OrchestratorResponse:
     # -------------------------------------------------------------------------
     try:
         logger.info("Step 5: Executing Cube query...")
-        cube_client = CubeClient()
+        cube_client = _get_cube_client()
         cube_response = cube_client.load(cube_query)
         response.data = cube_response.data
         response.request_id = cube_response.request_id
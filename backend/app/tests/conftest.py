@@ -0,0 +1,203 @@
+"""
+Shared pytest configuration for the backend test suite.
+
+Paths are resolved once here and handed to the test modules through
+fixtures instead of each module re-deriving them from its own
+``__file__``. The catalog fixture is session-scoped so catalog.yaml is
+loaded once per run.
+
+LLM extractions made by the E2E tests are recorded in .intent_cache.json
+and replayed on later runs. ``--intent-mode`` picks how Claude is used:
+
+- record (default): replay recorded extractions, call Claude on a miss
+- replay: recorded extractions only, no API key needed; misses skip
+- live: always call Claude, never read or write the cache
+
+Set REFRESH_INTENT_CACHE=1 to ignore existing recordings in record mode.
+Under pytest-xdist each worker records into .intent_cache.<worker>.json and
+the controller merges those shards into .intent_cache.json at session end.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import pytest
+
+from app.services.catalog_manager import CatalogManager
+
+# =============================================================================
+# Paths
+# =============================================================================
+
+BACKEND_ROOT = Path(__file__).resolve().parents[2]
+CATALOG_PATH = BACKEND_ROOT / "catalog" / "catalog.yaml"
+INTENT_CACHE_PATH = Path(__file__).resolve().parent / ".intent_cache.json"
+
+
+# =============================================================================
+# Options & Collection
+# =============================================================================
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--intent-mode",
+        choices=("record", "replay", "live"),
+        default="record",
+        help="How E2E tests obtain LLM extractions (default: record)",
+    )
+    parser.addoption(
+        "--extraction-workers",
+        type=int,
+        default=1,
+        help="Concurrent pipeline/Claude calls in the E2E suites (default: 1)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip every test that needs Claude up front when no API key is set."""
+    if os.getenv("ANTHROPIC_API_KEY") or config.getoption("--intent-mode") == "replay":
+        return
+    skip = pytest.mark.skip(reason="ANTHROPIC_API_KEY environment variable not set")
+    for item in items:
+        if "api_key_check" in item.fixturenames:
+            item.add_marker(skip)
+
+
+def pytest_sessionfinish(session):
+    """Fold the per-worker intent cache shards into the shared cache file."""
+    if hasattr(session.config, "workerinput"):
+        return  # xdist worker; the controller merges once all workers are done
+    shards = _intent_cache_shards()
+    if shards:
+        _write_intent_cache(INTENT_CACHE_PATH, _read_intent_cache())
+        for shard in shards:
+            shard.unlink()
+
+
+# =============================================================================
+# Intent Cache Files
+# =============================================================================
+
+def _intent_cache_shards() -> List[Path]:
+    """Per-worker cache files left by pytest-xdist workers (.intent_cache.gw0.json)."""
+    return sorted(INTENT_CACHE_PATH.parent.glob(".intent_cache.*.json"))
+
+
+def _load_intent_cache_file(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Entries of one cache file ({} if it does not exist)."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _read_intent_cache() -> Dict[str, Dict[str, Any]]:
+    """Recorded extractions from the shared file plus any unmerged shards."""
+    cache: Dict[str, Dict[str, Any]] = {}
+    for path in (INTENT_CACHE_PATH, *_intent_cache_shards()):
+        cache.update(_load_intent_cache_file(path))
+    return cache
+
+
+def _write_intent_cache(path: Path, cache: Dict[str, Dict[str, Any]]) -> None:
+    """Replace a cache file atomically so readers never see a partial write."""
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(cache, indent=2), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def catalog_path() -> str:
+    """Path of the backend's catalog.yaml."""
+    return str(CATALOG_PATH)
+
+
+@pytest.fixture(scope="session")
+def catalog(catalog_path) -> CatalogManager:
+    """Catalog manager shared by every test module."""
+    return CatalogManager(catalog_path)
+
+
+@pytest.fixture(scope="session")
+def api_key_check(pytestconfig) -> Optional[str]:
+    """Verify API key is available (not required when replaying)."""
+    api_key = os.getenv("ANTHROPIC_API_KEY")
+    if not api_key and pytestconfig.getoption("--intent-mode") != "replay":
+        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
+    return api_key
+
+
+@pytest.fixture(scope="session")
+def orchestrator(api_key_check, extract_intent_cached):
+    """
+    query_orchestrator with its catalog and clients created once.
+    
+    Extraction goes through the recorded intent cache (per --intent-mode),
+    so re-running the pipeline tests only calls Claude for new queries.
+    """
+    from app.services import query_orchestrator
+
+    query_orchestrator.warmup()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(query_orchestrator, "extract_intent", extract_intent_cached)
+        yield query_orchestrator
+
+
+@pytest.fixture(scope="session")
+def extract_intent_cached(pytestconfig) -> Callable[[str], Dict[str, Any]]:
+    """
+    extract_intent, memoized on disk by query.
+    
+    The cache key also covers the model, prompt template and catalog text,
+    so editing any of them invalidates old recordings. Only successful
+    extractions are stored; errors always go back to the API.
+    """
+    from app.services import intent_extractor
+
+    mode = pytestconfig.getoption("--intent-mode")
+    if mode == "live":
+        return intent_extractor.extract_intent
+
+    cache: Dict[str, Dict[str, Any]] = {}
+    if os.getenv("REFRESH_INTENT_CACHE") != "1":
+        cache = _read_intent_cache()
+
+    salt = "\0".join((
+        intent_extractor.MODEL_ID,
+        intent_extractor._load_prompt_template(),
+        intent_extractor._load_catalog(),
+    ))
+
+    # Under pytest-xdist each worker records into its own shard, which the
+    # controller merges into the shared file at session end; only a single
+    # process ever writes a given file.
+    worker_id = os.getenv("PYTEST_XDIST_WORKER")
+    if worker_id:
+        write_path = INTENT_CACHE_PATH.with_name(f".intent_cache.{worker_id}.json")
+    else:
+        write_path = INTENT_CACHE_PATH
+    recorded: Dict[str, Dict[str, Any]] = {}
+    write_lock = threading.Lock()
+
+    def extract(query: str) -> Dict[str, Any]:
+        key = hashlib.sha256(f"{salt}\0{query}".encode()).hexdigest()
+        if key not in cache:
+            if mode == "replay":
+                pytest.skip(f"No recorded extraction for query: {query[:60]!r}")
+            intent = intent_extractor.extract_intent(query)
+            # The API call stays outside the lock so threaded callers overlap
+            with write_lock:
+                cache[key] = intent
+                recorded[key] = intent
+                _write_intent_cache(write_path, {**_load_intent_cache_file(write_path), **recorded})
+        return copy.deepcopy(cache[key])
+
+    return extract
@@ -1,17 +1,8 @@
 """Pytest tests for CatalogManager with new catalog structure."""
 
 import pytest
-from pathlib import Path
 from app.services.catalog_manager import CatalogManager, CatalogError, AmbiguousResolutionError
 
-CATALOG_PATH = str(Path(__file__).parent.parent.parent / "catalog" / "catalog.yaml")
-
-
-@pytest.fixture
-def catalog():
-    """Fixture to load the catalog manager."""
-    return CatalogManager(CATALOG_PATH)
-
 
 class TestCatalogLoading:
     def test_catalog_loads_successfully(self, catalog):
@@ -24,6 +15,13 @@ class TestCatalogLoading:
         assert "dimensions" in raw
         assert "time_dimensions" in raw
 
+    def test_instances_do_not_share_catalog_data(self, catalog, catalog_path):
+        other = CatalogManager(catalog_path)
+        assert other.raw_catalog() == catalog.raw_catalog()
+        other.list_metrics()[0]["name"] = "changed"
+        assert catalog.list_metrics()[0]["name"] != "changed"
+        assert CatalogManager(catalog_path).list_metrics()[0]["name"] != "changed"
+
 
 class TestMetrics:
     def test_list_metrics(self, catalog):
@@ -109,15 +107,36 @@ class TestTimeWindows:
 
 
 class TestValidation:
-    def test_is_valid_metric(self, catalog):
-        assert catalog.is_valid_metric("total_quantity") is True
-        assert catalog.is_valid_metric("units sold") is True
-        assert catalog.is_valid_metric("fake_metric") is False
-
-    def test_is_valid_dimension(self, catalog):
-        assert catalog.is_valid_dimension("brand") is True
-        assert catalog.is_valid_dimension("channel") is True
-        assert catalog.is_valid_dimension("fake_dim") is False
+    @pytest.mark.parametrize("name,ok", [
+        ("total_quantity", True),
+        ("units sold", True),
+        ("fake_metric", False),
+    ])
+    def test_is_valid_metric(self, catalog, name, ok):
+        assert catalog.is_valid_metric(name) is ok
+
+    @pytest.mark.parametrize("name,ok", [
+        ("brand", True),
+        ("channel", True),
+        ("fake_dim", False),
+    ])
+    def test_is_valid_dimension(self, catalog, name, ok):
+        assert catalog.is_valid_dimension(name) is ok
+
+    @pytest.mark.parametrize("name,ok", [
+        ("invoice_date", True),
+        ("fake_date", False),
+    ])
+    def test_is_valid_time_dimension(self, catalog, name, ok):
+        assert catalog.is_valid_time_dimension(name) is ok
+
+    @pytest.mark.parametrize("name,ok", [
+        ("last_7_days", True),
+        ("MTD", True),
+        ("fake_window", False),
+    ])
+    def test_is_valid_time_window(self, catalog, name, ok):
+        assert catalog.is_valid_time_window(name) is ok
 
 
 class TestSearch:
@@ -129,6 +148,11 @@ class TestSearch:
         results = catalog.search_dimensions("store")
         assert len(results) >= 1
 
+    def test_has_matching(self, catalog):
+        assert catalog.has_metric_matching("quantity")
+        assert catalog.has_dimension_matching("store")
+        assert not catalog.has_metric_matching("xyz_no_such_term")
+
 
 class TestPriorityFiltering:
     def test_high_priority_metrics(self, catalog):
@@ -139,6 +163,11 @@ class TestPriorityFiltering:
         filterable = catalog.get_filterable_dimensions()
         assert all(d.get("filterable", False) for d in filterable)
 
+    def test_iter_matches_list_form(self, catalog):
+        assert all(m["priority"] == "high" for m in catalog.iter_high_priority_metrics())
+        assert list(catalog.iter_high_priority_metrics()) == catalog.get_high_priority_metrics()
+        assert list(catalog.iter_filterable_dimensions()) == catalog.get_filterable_dimensions()
+
 
 class TestNewSections:
     def test_intent_types(self, catalog):
@@ -209,6 +238,11 @@ class TestCaseInsensitivity:
         assert catalog.is_valid_dimension("BRAND") is True
         assert catalog.is_valid_time_window("MTD") is True
 
+    def test_lookup_by_id_is_case_insensitive(self, catalog):
+        """Cube IDs should resolve through the same lowercase index."""
+        assert catalog.find_metrics("SALES_FACT.QUANTITY") == [catalog.resolve_metric("total_quantity")]
+        assert catalog.find_dimensions("Skus.Brand")[0]["name"] == "brand"
+
 
 class TestAliasCollisions:
     """Test that alias collisions are properly detected and don't silently pick one."""
@@ -237,6 +271,14 @@ class TestAliasCollisions:
         assert hasattr(result, 'all_matches')
         assert hasattr(result, 'item_type')
 
+    def test_find_returns_a_copy_of_the_index(self, catalog):
+        """Mutating a returned match list must not change later lookups."""
+        catalog.find_metrics("sales_fact.quantity").clear()
+        catalog.find_dimensions("brand").append({"id": "bogus"})
+        
+        assert catalog.find_metrics("sales_fact.quantity") == [catalog.resolve_metric("total_quantity")]
+        assert len(catalog.find_dimensions("brand")) == 1
+
     def test_invalid_term_returns_empty_matches(self, catalog):
         """Invalid terms should return empty matches, not error."""
         matches = catalog.find_metrics("completely_fake_metric_xyz")
@@ -0,0 +1,46 @@
+"""Tests for the Cube client's HTTP connection pool lifecycle."""
+
+import pytest
+
+from app.services.cube_client import CubeClient, CubeConnectionError, execute_cube_query
+
+# -------------------------------------------------------------------
+# Tests - Connection Pool Lifecycle
+# -------------------------------------------------------------------
+
+def test_context_manager_closes_connection_pool():
+    """Leaving the with-block closes the client's HTTP pool."""
+    with CubeClient() as client:
+        assert client._http.is_closed is False
+
+    assert client._http.is_closed is True
+
+
+def test_execute_cube_query_closes_its_client(monkeypatch):
+    """The one-shot helper does not leave a connection pool open."""
+    clients = []
+    original_init = CubeClient.__init__
+
+    def tracking_init(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        clients.append(self)
+
+    monkeypatch.setattr(CubeClient, "__init__", tracking_init)
+    monkeypatch.setattr("app.services.cube_client.CUBE_API_URL", "http://127.0.0.1:1")
+
+    with pytest.raises(CubeConnectionError):
+        execute_cube_query({"measures": ["sales_fact.count"]})
+
+    assert len(clients) == 1
+    assert clients[0]._http.is_closed is True
+
+
+def test_pipeline_shutdown_closes_shared_client():
+    """The orchestrator's shutdown closes and drops its shared client."""
+    from app.services import query_orchestrator
+
+    client = query_orchestrator._get_cube_client()
+    query_orchestrator.shutdown()
+
+    assert client._http.is_closed is True
+    assert query_orchestrator._cube_client is None
@@ -11,19 +11,25 @@ IMPORTANT:
 - Use pytest -v --tb=long to see detailed output
 - Run with pytest -x to stop at first failure
 
+PYTEST_DONT_REWRITE: every assert here carries its own message, so
+pytest's assertion rewriting is skipped for this module.
+
 Usage:
     pytest backend/app/tests/test_intent_extraction_e2e.py -v -x
-    pytest backend/app/tests/test_intent_extraction_e2e.py -v -k "test_sales_performance"
+    pytest backend/app/tests/test_intent_extraction_e2e.py -v -k "TestIntentExtraction and revenue"
+    pytest backend/app/tests/test_intent_extraction_e2e.py -v -m territory
 """
 
-import os
+import json
+import re
+import sys
 import logging
 import pytest
-from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+from dataclasses import dataclass, field
 
-from app.services.intent_extractor import extract_intent, ExtractionError
 from app.services.catalog_manager import CatalogManager
 from app.services.intent_validator import validate_intent, IntentValidator
 from app.services.intent_errors import IntentValidationError
@@ -38,16 +44,21 @@ logger = logging.getLogger(__name__)
 # Test Configuration
 # =============================================================================
 
-@dataclass
+# All valid intent types from catalog
+VALID_INTENT_TYPES = frozenset({
+    "snapshot", "trend", "comparison", "ranking", "distribution", "drill_down",
+})
+
+@dataclass(frozen=True, slots=True)
 class TestCase:
     """Represents a single test case for intent extraction."""
     query: str
     category: str
     description: str
     # Allow multiple valid intent types since LLM may choose different valid interpretations
-    valid_intent_types: Optional[List[str]] = None  # Changed from expected_intent_type
+    valid_intent_types: Optional[Tuple[str, ...]] = None  # Changed from expected_intent_type
     expected_metric: Optional[str] = None
-    expected_group_by: Optional[List[str]] = None
+    expected_group_by: Optional[Tuple[str, ...]] = None
     expected_filters: Optional[List[Dict[str, Any]]] = None
     expected_time_range_window: Optional[str] = None
     expected_time_dimension: Optional[str] = None
@@ -56,26 +67,14 @@ class TestCase:
     should_have_time_range: bool = False
     should_have_time_dimension: bool = False
     should_have_group_by: bool = False  # New: check if group_by is present
+    # Membership views of the list fields above, built once per case
+    _valid_intent_types_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    _expected_group_by_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
 
-
-# =============================================================================
-# Fixtures
-# =============================================================================
-
-@pytest.fixture(scope="session")
-def catalog() -> CatalogManager:
-    """Load catalog manager for validation."""
-    catalog_path = Path(__file__).parent.parent.parent / "catalog" / "catalog.yaml"
-    return CatalogManager(str(catalog_path))
-
-
-@pytest.fixture(scope="session")
-def api_key_check():
-    """Verify API key is available."""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    return api_key
+    def __post_init__(self):
+        object.__setattr__(self, "category", sys.intern(self.category))
+        object.__setattr__(self, "_valid_intent_types_set", frozenset(self.valid_intent_types or ()))
+        object.__setattr__(self, "_expected_group_by_set", frozenset(self.expected_group_by or ()))
 
 
 # =============================================================================
@@ -87,7 +86,7 @@ SALES_PERFORMANCE_TESTS = [
         query="What is the total Primary vs. Secondary sales revenue for the first quarter of 2024?",
         category="Sales Performance & Trends",
         description="Compare primary vs secondary sales with explicit date range",
-        valid_intent_types=["snapshot", "comparison"],  # Both valid interpretations
+        valid_intent_types=("snapshot", "comparison"),  # Both valid interpretations
         should_have_time_range=True,
         should_have_group_by=True,  # Should group by sales_type for comparison
     ),
@@ -95,7 +94,7 @@ SALES_PERFORMANCE_TESTS = [
         query="Which month saw the highest growth in Tertiary (end-consumer) sales?",
         category="Sales Performance & Trends",
         description="Trend analysis for tertiary sales by month",
-        valid_intent_types=["trend", "ranking"],
+        valid_intent_types=("trend", "ranking"),
         should_have_filters=True,  # Should filter by sales_type = TERTIARY
         should_have_time_dimension=True,
         expected_granularity="month",
@@ -104,14 +103,14 @@ SALES_PERFORMANCE_TESTS = [
     #     query="What is the average discount percentage given on Primary sales compared to Secondary sales?",
     #     category="Sales Performance & Trends",
     #     description="Compare discounts between primary and secondary sales",
-    #     valid_intent_types=["snapshot", "comparison"],
+    #     valid_intent_types=("snapshot", "comparison"),
     #     should_have_group_by=True,
     # ),
     # TestCase(
     #     query="Identify the top 5 SKUs by total net_amount across all territories.",
     #     category="Sales Performance & Trends",
     #     description="Ranking query for top SKUs",
-    #     valid_intent_types=["ranking", "snapshot"],
+    #     valid_intent_types=("ranking", "snapshot"),
     #     should_have_group_by=True,
     # ),
 ]
@@ -126,14 +125,14 @@ TERRITORY_TESTS = [
         query="Which Region (North, South, East, West) is contributing the most to the total gross amount?",
         category="Territory & Regional Insights",
         description="Regional breakdown of gross amount",
-        valid_intent_types=["snapshot", "ranking", "distribution"],
+        valid_intent_types=("snapshot", "ranking", "distribution"),
         should_have_group_by=True,
     ),
     TestCase(
         query="Compare the sales performance of Metro zones versus Rural zones for the 'Beverages' category.",
         category="Territory & Regional Insights",
         description="Zone comparison with category filter",
-        valid_intent_types=["comparison", "snapshot", "distribution"],
+        valid_intent_types=("comparison", "snapshot", "distribution"),
         should_have_group_by=True,
         should_have_filters=True,  # Should filter by category = Beverages
     ),
@@ -141,7 +140,7 @@ TERRITORY_TESTS = [
         query="List the top 3 territories in the 'South' region based on Secondary sales volume.",
         category="Territory & Regional Insights",
         description="Territory ranking with region filter",
-        valid_intent_types=["ranking", "snapshot"],
+        valid_intent_types=("ranking", "snapshot"),
         should_have_group_by=True,
         should_have_filters=True,  # Should filter by region = South, sales_type = SECONDARY
     ),
@@ -149,7 +148,7 @@ TERRITORY_TESTS = [
         query="Which state has the highest number of active retail outlets?",
         category="Territory & Regional Insights",
         description="State-wise outlet count",
-        valid_intent_types=["ranking", "snapshot", "distribution"],
+        valid_intent_types=("ranking", "snapshot", "distribution"),
         should_have_group_by=True,
     ),
 ]
@@ -164,7 +163,7 @@ DISTRIBUTION_TESTS = [
     #     query="Which Distributors are currently exceeding their credit limits based on unpaid credit invoices?",
     #     category="Distribution & Channel Analysis",
     #     description="Distributor credit analysis",
-    #     valid_intent_types=["snapshot", "ranking"],
+    #     valid_intent_types=("snapshot", "ranking"),
     #     should_have_group_by=True,
     #     should_have_filters=True,  # Credit filter
     # ),
@@ -172,14 +171,14 @@ DISTRIBUTION_TESTS = [
     #     query="Calculate the 'Fill Rate'—what is the ratio of Primary sales (to distributors) to Secondary sales (to retailers) for each distributor?",
     #     category="Distribution & Channel Analysis",
     #     description="Fill rate calculation per distributor",
-    #     valid_intent_types=["snapshot", "distribution"],
+    #     valid_intent_types=("snapshot", "distribution"),
     #     should_have_group_by=True,
     # ),
     TestCase(
         query="Identify outlets that have not placed a Secondary order in the last 30 days.",
         category="Distribution & Channel Analysis",
         description="Inactive outlets identification",
-        valid_intent_types=["snapshot", "ranking"],
+        valid_intent_types=("snapshot", "ranking"),
         should_have_filters=True,
         should_have_time_range=True,
     ),
@@ -187,7 +186,7 @@ DISTRIBUTION_TESTS = [
         query="What is the most popular Outlet Type (Kirana vs. Modern Trade) for the 'Snacks' brand 'CrunchTime'?",
         category="Distribution & Channel Analysis",
         description="Outlet type analysis with brand filter",
-        valid_intent_types=["ranking", "snapshot", "distribution"],
+        valid_intent_types=("ranking", "snapshot", "distribution"),
         should_have_group_by=True,
         should_have_filters=True,  # Brand filter
     ),
@@ -203,14 +202,14 @@ PRODUCT_TESTS = [
     #     query="Which Category has the highest 'Scheme Discount' burden relative to its total sales?",
     #     category="Product & Category Intelligence",
     #     description="Category discount analysis",
-    #     valid_intent_types=["ranking", "snapshot", "distribution"],
+    #     valid_intent_types=("ranking", "snapshot", "distribution"),
     #     should_have_group_by=True,
     # ),
     TestCase(
         query="What is the most popular pack_size for 'FreshCo Cola' across all Metro cities?",
         category="Product & Category Intelligence",
         description="Pack size analysis with brand and zone filter",
-        valid_intent_types=["ranking", "snapshot", "distribution"],
+        valid_intent_types=("ranking", "snapshot", "distribution"),
         should_have_group_by=True,
         should_have_filters=True,  # Brand and zone filters
     ),
@@ -218,14 +217,14 @@ PRODUCT_TESTS = [
     #     query="List SKUs where the mrp (Maximum Retail Price) is more than 20% higher than the base_price in Secondary sales.",
     #     category="Product & Category Intelligence",
     #     description="SKU price margin analysis",
-    #     valid_intent_types=["snapshot", "ranking"],
+    #     valid_intent_types=("snapshot", "ranking"),
     #     should_have_filters=True,  # Sales type filter
     # ),
     TestCase(
         query="Find the sub-categories that are underperforming in the 'West' region.",
         category="Product & Category Intelligence",
         description="Sub-category performance by region",
-        valid_intent_types=["ranking", "snapshot", "distribution"],
+        valid_intent_types=("ranking", "snapshot", "distribution"),
         should_have_group_by=True,
         should_have_filters=True,  # Region filter
     ),
@@ -241,7 +240,7 @@ SALES_REP_TESTS = [
         query="Rank the Sales Reps (SR codes) by the total number of unique outlets they serviced in March 2024.",
         category="Sales Representative Productivity",
         description="Sales rep ranking by outlet coverage",
-        valid_intent_types=["ranking", "snapshot"],
+        valid_intent_types=("ranking", "snapshot"),
         should_have_group_by=True,
         should_have_time_range=True,
     ),
@@ -249,14 +248,14 @@ SALES_REP_TESTS = [
     #     query="What is the average invoice value generated by SR-101 compared to the territory average?",
     #     category="Sales Representative Productivity",
     #     description="Sales rep comparison to average",
-    #     valid_intent_types=["comparison", "snapshot"],
+    #     valid_intent_types=("comparison", "snapshot"),
     #     should_have_filters=True,  # Filter by sales_rep = SR-101
     # ),
     TestCase(
         query="Which Sales Rep has the highest percentage of Credit sales vs. Cash sales?",
         category="Sales Representative Productivity",
         description="Sales rep credit vs cash analysis",
-        valid_intent_types=["ranking", "snapshot", "comparison"],
+        valid_intent_types=("ranking", "snapshot", "comparison"),
         should_have_group_by=True,
     ),
 ]
@@ -274,21 +273,54 @@ ALL_TEST_CASES = (
     SALES_REP_TESTS
 )
 
+# Each case carries its category as a marker (registered in pytest.ini),
+# so e.g. `pytest -m territory` still selects a single category.
+ALL_TEST_PARAMS = [
+    pytest.param(tc, marks=getattr(pytest.mark, marker), id=tc.description[:40])
+    for marker, cases in (
+        ("sales_performance", SALES_PERFORMANCE_TESTS),
+        ("territory", TERRITORY_TESTS),
+        ("distribution", DISTRIBUTION_TESTS),
+        ("product", PRODUCT_TESTS),
+        ("sales_rep", SALES_REP_TESTS),
+    )
+    for tc in cases
+]
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
+@functools.cache
+def _get_extractor():
+    """
+    Import the extractor on first use.
+    
+    intent_extractor pulls in the Anthropic SDK (~1s), so keep it out of
+    collection and out of runs where api_key_check skips everything.
+    """
+    from app.services.intent_extractor import extract_intent, ExtractionError
+    return extract_intent, ExtractionError
+
+
 def run_extraction_and_validation(
     query: str, 
-    catalog: CatalogManager
+    catalog: CatalogManager,
+    extract: Optional[Callable[[str], Dict[str, Any]]] = None,
 ) -> tuple[Dict[str, Any], Optional[Intent], Optional[Exception]]:
     """
     Run extraction and validation for a query.
     
+    `extract` defaults to the live extract_intent; tests pass the
+    disk-memoized extract_intent_cached fixture instead.
+    
     Returns:
         (raw_intent, validated_intent, error)
     """
+    extract_intent, ExtractionError = _get_extractor()
+    if extract is None:
+        extract = extract_intent
     raw_intent = None
     validated_intent = None
     error = None
@@ -299,7 +331,7 @@ def run_extraction_and_validation(
         logger.info(f"QUERY: {query}")
         logger.info(f"{'='*60}")
         
-        raw_intent = extract_intent(query)
+        raw_intent = extract(query)
         logger.info(f"RAW INTENT: {raw_intent}")
         
         # Step 2: Validate intent
@@ -319,6 +351,90 @@ def run_extraction_and_validation(
     return raw_intent, validated_intent, error
 
 
+def _skip_unknown_metric(error_msg, fields, test_case, intent_context) -> str:
+    return (
+        f"SKIP REASON: Unknown metric '{fields['metric'] if fields['has_raw_intent'] else 'unknown'}' not in catalog.\n"
+        f"  - Query: \"{test_case.query[:80]}...\"\n"
+        f"  - Error: {error_msg[:150]}"
+        f"{intent_context}"
+    )
+
+
+def _skip_unknown_dimension(error_msg, fields, test_case, intent_context) -> str:
+    return (
+        f"SKIP REASON: Unknown dimension in group_by or filters.\n"
+        f"  - Query: \"{test_case.query[:80]}...\"\n"
+        f"  - Error: {error_msg[:150]}"
+        f"{intent_context}"
+    )
+
+
+def _skip_malformed(error_msg, fields, test_case, intent_context) -> str:
+    # Parse out specific malformed field
+    if "intent_type" in error_msg:
+        return (
+            f"SKIP REASON: Invalid intent_type value.\n"
+            f"  - Query: \"{test_case.query[:80]}...\"\n"
+            f"  - LLM returned intent_type='{fields['intent_type']}'\n"
+            f"  - Error: {error_msg[:150]}"
+        )
+    lowered = error_msg.lower()
+    if "metric" in lowered:
+        return (
+            f"SKIP REASON: Missing or invalid metric field.\n"
+            f"  - Query: \"{test_case.query[:80]}...\"\n"
+            f"  - LLM returned metric='{fields['metric']}'\n"
+            f"  - Error: {error_msg[:150]}"
+        )
+    if "time_dimension" in lowered:
+        return (
+            f"SKIP REASON: TREND intent missing required time_dimension.\n"
+            f"  - Query: \"{test_case.query[:80]}...\"\n"
+            f"  - Error: {error_msg[:150]}"
+            f"{intent_context}"
+        )
+    if "group_by" in lowered:
+        return (
+            f"SKIP REASON: Intent type requires group_by but none provided.\n"
+            f"  - Query: \"{test_case.query[:80]}...\"\n"
+            f"  - Error: {error_msg[:150]}"
+            f"{intent_context}"
+        )
+    return (
+        f"SKIP REASON: Malformed intent structure.\n"
+        f"  - Query: \"{test_case.query[:80]}...\"\n"
+        f"  - Error: {error_msg[:200]}"
+        f"{intent_context}"
+    )
+
+
+def _skip_invalid_time_window(error_msg, fields, test_case, intent_context) -> str:
+    return (
+        f"SKIP REASON: Invalid time_window '{fields['window']}' not in catalog.\n"
+        f"  - Query: \"{test_case.query[:80]}...\"\n"
+        f"  - Error: {error_msg[:150]}"
+    )
+
+
+def _skip_invalid_granularity(error_msg, fields, test_case, intent_context) -> str:
+    return (
+        f"SKIP REASON: Invalid granularity '{fields['granularity']}'.\n"
+        f"  - Query: \"{test_case.query[:80]}...\"\n"
+        f"  - Error: {error_msg[:150]}"
+    )
+
+
+# Failure categories in priority order: the first pattern found anywhere in
+# the error message picks the handler, whatever its position in the text.
+_SKIP_CATEGORIES = (
+    (re.compile(r"UNKNOWN_METRIC|Unknown metric"), _skip_unknown_metric),
+    (re.compile(r"UNKNOWN_DIMENSION|Unknown dimension"), _skip_unknown_dimension),
+    (re.compile(r"MALFORMED_INTENT|Malformed intent"), _skip_malformed),
+    (re.compile(r"INVALID_TIME_WINDOW"), _skip_invalid_time_window),
+    (re.compile(r"INVALID_GRANULARITY"), _skip_invalid_granularity),
+)
+
+
 def get_detailed_skip_reason(
     error: Exception,
     raw_intent: Optional[Dict[str, Any]],
@@ -332,16 +448,25 @@ def get_detailed_skip_reason(
     error_type = type(error).__name__
     error_msg = str(error)
     
+    # Pull every field we report on out of the raw intent in one pass
+    ri = raw_intent or {}
+    intent_type = ri.get("intent_type", "null")
+    metric = ri.get("metric", "null")
+    group_by = ri.get("group_by") or ()
+    filters = ri.get("filters") or ()
+    time_range = ri.get("time_range") or {}
+    time_dimension = ri.get("time_dimension") or {}
+    fields = {
+        "has_raw_intent": bool(raw_intent),
+        "intent_type": intent_type,
+        "metric": metric,
+        "window": time_range.get("window") if isinstance(time_range, dict) else None,
+        "granularity": time_dimension.get("granularity") if isinstance(time_dimension, dict) else None,
+    }
+    
     # Build context from raw intent
     intent_context = ""
     if raw_intent:
-        intent_type = raw_intent.get("intent_type", "null")
-        metric = raw_intent.get("metric", "null")
-        group_by = raw_intent.get("group_by", [])
-        filters = raw_intent.get("filters", [])
-        time_range = raw_intent.get("time_range")
-        time_dimension = raw_intent.get("time_dimension")
-        
         intent_context = f"\n  - LLM returned intent_type='{intent_type}', metric='{metric}'"
         if group_by:
             intent_context += f", group_by={group_by}"
@@ -354,75 +479,9 @@ def get_detailed_skip_reason(
             intent_context += f", time_dimension={time_dimension}"
     
     # Categorize the specific failure
-    if "UNKNOWN_METRIC" in error_msg or "Unknown metric" in error_msg:
-        metric_val = raw_intent.get("metric") if raw_intent else "unknown"
-        return (
-            f"SKIP REASON: Unknown metric '{metric_val}' not in catalog.\n"
-            f"  - Query: \"{test_case.query[:80]}...\"\n"
-            f"  - Error: {error_msg[:150]}"
-            f"{intent_context}"
-        )
-    
-    if "UNKNOWN_DIMENSION" in error_msg or "Unknown dimension" in error_msg:
-        return (
-            f"SKIP REASON: Unknown dimension in group_by or filters.\n"
-            f"  - Query: \"{test_case.query[:80]}...\"\n"
-            f"  - Error: {error_msg[:150]}"
-            f"{intent_context}"
-        )
-    
-    if "MALFORMED_INTENT" in error_msg or "Malformed intent" in error_msg:
-        # Parse out specific malformed field
-        if "intent_type" in error_msg:
-            return (
-                f"SKIP REASON: Invalid intent_type value.\n"
-                f"  - Query: \"{test_case.query[:80]}...\"\n"
-                f"  - LLM returned intent_type='{raw_intent.get('intent_type') if raw_intent else 'null'}'\n"
-                f"  - Error: {error_msg[:150]}"
-            )
-        if "metric" in error_msg.lower():
-            return (
-                f"SKIP REASON: Missing or invalid metric field.\n"
-                f"  - Query: \"{test_case.query[:80]}...\"\n"
-                f"  - LLM returned metric='{raw_intent.get('metric') if raw_intent else 'null'}'\n"
-                f"  - Error: {error_msg[:150]}"
-            )
-        if "time_dimension" in error_msg.lower():
-            return (
-                f"SKIP REASON: TREND intent missing required time_dimension.\n"
-                f"  - Query: \"{test_case.query[:80]}...\"\n"
-                f"  - Error: {error_msg[:150]}"
-                f"{intent_context}"
-            )
-        if "group_by" in error_msg.lower():
-            return (
-                f"SKIP REASON: Intent type requires group_by but none provided.\n"
-                f"  - Query: \"{test_case.query[:80]}...\"\n"
-                f"  - Error: {error_msg[:150]}"
-                f"{intent_context}"
-            )
-        return (
-            f"SKIP REASON: Malformed intent structure.\n"
-            f"  - Query: \"{test_case.query[:80]}...\"\n"
-            f"  - Error: {error_msg[:200]}"
-            f"{intent_context}"
-        )
-    
-    if "INVALID_TIME_WINDOW" in error_msg:
-        time_window = raw_intent.get("time_range", {}).get("window") if raw_intent else None
-        return (
-            f"SKIP REASON: Invalid time_window '{time_window}' not in catalog.\n"
-            f"  - Query: \"{test_case.query[:80]}...\"\n"
-            f"  - Error: {error_msg[:150]}"
-        )
-    
-    if "INVALID_GRANULARITY" in error_msg:
-        granularity = raw_intent.get("time_dimension", {}).get("granularity") if raw_intent else None
-        return (
-            f"SKIP REASON: Invalid granularity '{granularity}'.\n"
-            f"  - Query: \"{test_case.query[:80]}...\"\n"
-            f"  - Error: {error_msg[:150]}"
-        )
+    for pattern, handler in _SKIP_CATEGORIES:
+        if pattern.search(error_msg):
+            return handler(error_msg, fields, test_case, intent_context)
     
     # Default: return error type and message with context
     return (
@@ -436,16 +495,13 @@ def get_detailed_skip_reason(
 def assert_intent_structure(intent: Intent, test_case: TestCase):
     """Assert that the intent matches expected structure."""
     
-    # All valid intent types from catalog
-    VALID_INTENT_TYPES = ["snapshot", "trend", "comparison", "ranking", "distribution", "drill_down"]
-    
     # Check intent type is valid
     assert intent.intent_type in VALID_INTENT_TYPES, \
-        f"Invalid intent_type: {intent.intent_type}. Must be one of {VALID_INTENT_TYPES}"
+        f"Invalid intent_type: {intent.intent_type}. Must be one of {sorted(VALID_INTENT_TYPES)}"
     
     # Check intent type if specific types are expected
     if test_case.valid_intent_types:
-        assert intent.intent_type in test_case.valid_intent_types, \
+        assert intent.intent_type in test_case._valid_intent_types_set, \
             f"Expected intent_type in {test_case.valid_intent_types}, got {intent.intent_type}"
     
     # Check metric if expected
@@ -456,9 +512,9 @@ def assert_intent_structure(intent: Intent, test_case: TestCase):
     # Check group_by if expected (specific dimensions)
     if test_case.expected_group_by:
         assert intent.group_by is not None, "Expected group_by but got None"
-        for expected_dim in test_case.expected_group_by:
-            assert expected_dim in intent.group_by, \
-                f"Expected {expected_dim} in group_by, got {intent.group_by}"
+        missing = test_case._expected_group_by_set.difference(intent.group_by)
+        assert not missing, \
+            f"Expected {sorted(missing)} in group_by, got {intent.group_by}"
     
     # Check group_by presence (just that it exists)
     if test_case.should_have_group_by:
@@ -495,14 +551,14 @@ def assert_intent_structure(intent: Intent, test_case: TestCase):
 # Test Classes
 # =============================================================================
 
-class TestSalesPerformance:
-    """Tests for Sales Performance & Trends queries."""
+class TestIntentExtraction:
+    """Extract and validate every query in ALL_TEST_CASES."""
     
-    @pytest.mark.parametrize("test_case", SALES_PERFORMANCE_TESTS, ids=lambda tc: tc.description[:40])
-    def test_sales_performance_query(self, api_key_check, catalog, test_case: TestCase):
-        """Test sales performance queries."""
+    @pytest.mark.parametrize("test_case", ALL_TEST_PARAMS)
+    def test_query(self, api_key_check, catalog, extract_intent_cached, test_case: TestCase):
+        """Test a single catalog query end to end."""
         raw_intent, validated_intent, error = run_extraction_and_validation(
-            test_case.query, catalog
+            test_case.query, catalog, extract_intent_cached
         )
         
         # Should not have extraction errors
@@ -523,133 +579,48 @@ class TestSalesPerformance:
         assert_intent_structure(validated_intent, test_case)
 
 
-class TestTerritoryInsights:
-    """Tests for Territory & Regional Insights queries."""
-    
-    @pytest.mark.parametrize("test_case", TERRITORY_TESTS, ids=lambda tc: tc.description[:40])
-    def test_territory_query(self, api_key_check, catalog, test_case: TestCase):
-        """Test territory and regional queries."""
-        raw_intent, validated_intent, error = run_extraction_and_validation(
-            test_case.query, catalog
-        )
-        
-        assert raw_intent is not None, f"Extraction failed: {error}"
-        
-        logger.info(f"\n[{test_case.category}] {test_case.description}")
-        logger.info(f"Query: {test_case.query}")
-        logger.info(f"Raw Intent: {raw_intent}")
-        
-        if error and isinstance(error, IntentValidationError):
-            skip_reason = get_detailed_skip_reason(error, raw_intent, test_case)
-            logger.warning(skip_reason)
-            pytest.skip(skip_reason)
-        
-        assert validated_intent is not None, f"Validation failed: {error}"
-        assert_intent_structure(validated_intent, test_case)
-
-
-class TestDistributionChannel:
-    """Tests for Distribution & Channel Analysis queries."""
-    
-    @pytest.mark.parametrize("test_case", DISTRIBUTION_TESTS, ids=lambda tc: tc.description[:40])
-    def test_distribution_query(self, api_key_check, catalog, test_case: TestCase):
-        """Test distribution and channel queries."""
-        raw_intent, validated_intent, error = run_extraction_and_validation(
-            test_case.query, catalog
-        )
-        
-        assert raw_intent is not None, f"Extraction failed: {error}"
-        
-        logger.info(f"\n[{test_case.category}] {test_case.description}")
-        logger.info(f"Query: {test_case.query}")
-        logger.info(f"Raw Intent: {raw_intent}")
-        
-        if error and isinstance(error, IntentValidationError):
-            skip_reason = get_detailed_skip_reason(error, raw_intent, test_case)
-            logger.warning(skip_reason)
-            pytest.skip(skip_reason)
-        
-        assert validated_intent is not None, f"Validation failed: {error}"
-        assert_intent_structure(validated_intent, test_case)
-
-
-class TestProductIntelligence:
-    """Tests for Product & Category Intelligence queries."""
-    
-    @pytest.mark.parametrize("test_case", PRODUCT_TESTS, ids=lambda tc: tc.description[:40])
-    def test_product_query(self, api_key_check, catalog, test_case: TestCase):
-        """Test product and category queries."""
-        raw_intent, validated_intent, error = run_extraction_and_validation(
-            test_case.query, catalog
-        )
-        
-        assert raw_intent is not None, f"Extraction failed: {error}"
-        
-        logger.info(f"\n[{test_case.category}] {test_case.description}")
-        logger.info(f"Query: {test_case.query}")
-        logger.info(f"Raw Intent: {raw_intent}")
-        
-        if error and isinstance(error, IntentValidationError):
-            skip_reason = get_detailed_skip_reason(error, raw_intent, test_case)
-            logger.warning(skip_reason)
-            pytest.skip(skip_reason)
-        
-        assert validated_intent is not None, f"Validation failed: {error}"
-        assert_intent_structure(validated_intent, test_case)
-
-
-class TestSalesRepProductivity:
-    """Tests for Sales Representative Productivity queries."""
-    
-    @pytest.mark.parametrize("test_case", SALES_REP_TESTS, ids=lambda tc: tc.description[:40])
-    def test_sales_rep_query(self, api_key_check, catalog, test_case: TestCase):
-        """Test sales rep productivity queries."""
-        raw_intent, validated_intent, error = run_extraction_and_validation(
-            test_case.query, catalog
-        )
-        
-        assert raw_intent is not None, f"Extraction failed: {error}"
-        
-        logger.info(f"\n[{test_case.category}] {test_case.description}")
-        logger.info(f"Query: {test_case.query}")
-        logger.info(f"Raw Intent: {raw_intent}")
-        
-        if error and isinstance(error, IntentValidationError):
-            skip_reason = get_detailed_skip_reason(error, raw_intent, test_case)
-            logger.warning(skip_reason)
-            pytest.skip(skip_reason)
-        
-        assert validated_intent is not None, f"Validation failed: {error}"
-        assert_intent_structure(validated_intent, test_case)
-
-
 # =============================================================================
 # Interactive Test Runner
 # =============================================================================
 
+BAR = "=" * 80
+DASH = "-" * 80
+
 class TestInteractiveSequential:
     """
     Run all tests sequentially with detailed output.
     
     Use this for debugging and reviewing each query one by one.
     Run with: pytest -v -k "test_all_queries_sequential" --capture=no
+    
+    Pass --extraction-workers N to make up to N Claude calls at once;
+    output is still printed in query order once results are in.
     """
     
-    def test_all_queries_sequential(self, api_key_check, catalog):
+    def test_all_queries_sequential(self, api_key_check, catalog, extract_intent_cached, pytestconfig):
         """Run all test queries sequentially with detailed logging."""
         results = []
         
-        for i, test_case in enumerate(ALL_TEST_CASES, 1):
-            print(f"\n{'='*80}")
-            print(f"TEST {i}/{len(ALL_TEST_CASES)}: {test_case.category}")
-            print(f"{'='*80}")
+        def run(test_case: TestCase):
+            return run_extraction_and_validation(test_case.query, catalog, extract_intent_cached)
+        
+        workers = pytestconfig.getoption("--extraction-workers")
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(run, ALL_TEST_CASES))
+        else:
+            outcomes = map(run, ALL_TEST_CASES)
+        
+        total = len(ALL_TEST_CASES)
+        for i, (test_case, outcome) in enumerate(zip(ALL_TEST_CASES, outcomes), 1):
+            raw_intent, validated_intent, error = outcome
+            
+            print(f"\n{BAR}\nTEST {i}/{total}: {test_case.category}\n{BAR}")
             print(f"Query: {test_case.query}")
             print(f"Description: {test_case.description}")
-            print("-" * 80)
+            print(DASH)
             
-            raw_intent, validated_intent, error = run_extraction_and_validation(
-                test_case.query, catalog
-            )
+            skip_reason = get_detailed_skip_reason(error, raw_intent, test_case) if error else None
             
             result = {
                 "index": i,
@@ -657,32 +628,29 @@ class TestInteractiveSequential:
                 "category": test_case.category,
                 "description": test_case.description,
                 "raw_intent": raw_intent,
-                "validated_intent": validated_intent.model_dump() if validated_intent else None,
+                "validated_intent": validated_intent,
                 "error": error,
                 "error_str": str(error) if error else None,
-                "skip_reason": get_detailed_skip_reason(error, raw_intent, test_case) if error else None,
+                "skip_reason": skip_reason,
                 "passed": error is None
             }
             results.append(result)
             
             if raw_intent:
                 print(f"\nRAW INTENT:")
-                import json
                 print(json.dumps(raw_intent, indent=2))
             
             if validated_intent:
                 print(f"\nVALIDATED INTENT:")
-                print(json.dumps(validated_intent.model_dump(), indent=2))
+                print(validated_intent.model_dump_json(indent=2))
             
             if error:
-                print(f"\n{get_detailed_skip_reason(error, raw_intent, test_case)}")
+                print(f"\n{skip_reason}")
             
             print(f"\nSTATUS: {'PASSED' if not error else 'FAILED'}")
         
         # Summary
-        print(f"\n{'='*80}")
-        print("SUMMARY")
-        print(f"{'='*80}")
+        print(f"\n{BAR}\nSUMMARY\n{BAR}")
         
         passed = sum(1 for r in results if r["passed"])
         failed = len(results) - passed
@@ -692,9 +660,7 @@ class TestInteractiveSequential:
         print(f"Failed: {failed}")
         
         if failed > 0:
-            print(f"\n{'='*80}")
-            print("FAILED TESTS - DETAILED REASONS")
-            print(f"{'='*80}")
+            print(f"\n{BAR}\nFAILED TESTS - DETAILED REASONS\n{BAR}")
             for r in results:
                 if not r["passed"]:
                     print(f"\n[{r['index']}] {r['description']}")
@@ -708,7 +674,7 @@ class TestInteractiveSequential:
 class TestSingleQuery:
     """Test a single query for debugging purposes."""
     
-    def test_single_query(self, api_key_check, catalog):
+    def test_single_query(self, api_key_check, catalog, extract_intent_cached):
         """
         Test a single query.
         
@@ -718,11 +684,9 @@ class TestSingleQuery:
         query = "What is the total Primary vs. Secondary sales revenue for the first quarter of 2024?"
         
         raw_intent, validated_intent, error = run_extraction_and_validation(
-            query, catalog
+            query, catalog, extract_intent_cached
         )
         
-        import json
-        
         print(f"\nQuery: {query}")
         print(f"\nRaw Intent:\n{json.dumps(raw_intent, indent=2) if raw_intent else 'None'}")
         
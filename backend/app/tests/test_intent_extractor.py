@@ -0,0 +1,91 @@
+"""Unit tests for the intent extractor's offline helpers (JSON parsing, prompt building)."""
+
+import pytest
+
+from app.services.intent_extractor import (
+    JSONParseError,
+    _build_prompt,
+    _load_catalog,
+    _load_prompt_template,
+    _parse_json_response,
+)
+
+# -------------------------------------------------------------------
+# Tests - JSON Response Parsing (code fences)
+# -------------------------------------------------------------------
+
+@pytest.mark.parametrize("raw", [
+    '```\n{"metric": "total_quantity"}\n```',
+    '```json\n{"metric": "total_quantity"}\n```',
+    '```json\n{"metric": "total_quantity"}',
+    '```json\n{"metric": "total_quantity"}\n   ```',
+    '```json\r\n{"metric": "total_quantity"}\r\n```\r\n',
+    '  {"metric": "total_quantity"}  \n',
+], ids=["fenced", "json-tagged", "unterminated", "indented-close", "crlf", "unfenced"])
+def test_parse_json_response_strips_code_fences(raw):
+    """Markdown code fences around the JSON object are removed before parsing."""
+    assert _parse_json_response(raw) == {"metric": "total_quantity"}
+
+
+def test_parse_json_response_keeps_backticks_inside_values():
+    """Only the outer fence is stripped, not backticks inside the payload."""
+    raw = '```json\n{"description": "a ``` b"}\n```'
+
+    assert _parse_json_response(raw) == {"description": "a ``` b"}
+
+
+def test_parse_json_response_rejects_non_object():
+    """A fenced JSON array is still rejected."""
+    with pytest.raises(JSONParseError):
+        _parse_json_response('```json\n[1, 2]\n```')
+
+
+def test_parse_json_response_rejects_invalid_json():
+    """Text that is not JSON raises JSONParseError."""
+    with pytest.raises(JSONParseError):
+        _parse_json_response("not json")
+
+
+# -------------------------------------------------------------------
+# Tests - Prompt Building (prompt caching blocks)
+# -------------------------------------------------------------------
+
+def _joined(blocks):
+    return "".join(block["text"] for block in blocks)
+
+
+def test_build_prompt_blocks_join_to_substituted_template():
+    """The blocks carry exactly the text of the substituted template."""
+    template = _load_prompt_template()
+    catalog = _load_catalog()
+    query = "What are the top 5 territories by total quantity?"
+
+    blocks = _build_prompt(query=query, catalog=catalog, template=template)
+
+    expected = template.replace("{catalog}", catalog).replace("{query}", query)
+    assert _joined(blocks) == expected
+
+
+def test_build_prompt_caches_only_the_static_prefix():
+    """Only the first block (instructions + catalog) is marked for caching."""
+    blocks = _build_prompt(query="sales by region", catalog="CATALOG",
+                           template="rules\n{catalog}\n{query}\n")
+
+    assert blocks[0]["cache_control"] == {"type": "ephemeral"}
+    assert "CATALOG" in blocks[0]["text"]
+    assert all("cache_control" not in block for block in blocks[1:])
+    assert blocks[-1]["text"] == "sales by region\n"
+
+
+@pytest.mark.parametrize("query,template", [
+    ("", "rules {catalog}\n{query}\n"),
+    ("", "rules {catalog}\n{query}"),
+    ("sales by region", "rules {catalog}\n{query}"),
+    ("sales by region", "rules {catalog}\n"),
+], ids=["empty-query", "empty-query-and-tail", "empty-tail", "no-query-marker"])
+def test_build_prompt_has_no_blank_blocks(query, template):
+    """No block is empty or whitespace-only, and the full text is preserved."""
+    blocks = _build_prompt(query=query, catalog="CATALOG", template=template)
+
+    assert all(block["text"].strip() for block in blocks)
+    assert _joined(blocks) == template.replace("{catalog}", "CATALOG").replace("{query}", query)
@@ -1,27 +1,14 @@
 import pytest
-from pathlib import Path
 
-from app.services.catalog_manager import CatalogManager
 from app.services.intent_validator import validate_intent
 from app.services.intent_errors import (
     UnknownMetricError,
     UnknownDimensionError,
     MalformedIntentError,
     InvalidTimeWindowError,
+    InvalidFilterError,
 )
 
-# -------------------------------------------------------------------
-# Fixtures
-# -------------------------------------------------------------------
-
-@pytest.fixture(scope="session")
-def catalog():
-    catalog_path = (
-        Path(__file__).parent.parent.parent / "catalog" / "catalog.yaml"
-    )
-    return CatalogManager(str(catalog_path))
-
-
 # -------------------------------------------------------------------
 # Tests - Snapshot Intent
 # -------------------------------------------------------------------
@@ -339,6 +326,26 @@ def test_valid_intent_with_filters(catalog):
     assert intent.filters[0].dimension == "region"
 
 
+def test_unknown_filter_dimension_raises_error(catalog):
+    """Test that a filter on an unknown dimension raises InvalidFilterError."""
+    raw = {
+        "intent_type": "snapshot",
+        "metric": "total_quantity",
+        "filters": [
+            {
+                "dimension": "fake_dimension",
+                "operator": "equals",
+                "value": "North",
+            }
+        ],
+    }
+
+    with pytest.raises(InvalidFilterError) as exc:
+        validate_intent(raw, catalog)
+
+    assert exc.value.ERROR_CODE == "INVALID_FILTER"
+
+
 def test_intent_with_multiple_filters(catalog):
     """Test intent with multiple filters."""
     raw = {
@@ -5,22 +5,22 @@ Tests the complete flow:
 Query → Intent Extraction → Validation → Cube Query Build → Cube Execution
 
 IMPORTANT: 
-- This test calls the actual Claude API
+- This test calls the actual Claude API (extractions are recorded in the
+  shared intent cache and replayed on later runs, see conftest.py)
 - This test requires a running Cube instance (skip if unavailable)
 
 Usage:
     pytest backend/app/tests/test_query_orchestrator_e2e.py -v --capture=no
 """
 
-import os
+import functools
 import json
 import logging
 import pytest
-from typing import Any, Dict, List, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Tuple
 
 from app.services.query_orchestrator import (
-    execute_query,
-    execute_query_dict,
     OrchestratorResponse,
     PipelineStage,
 )
@@ -111,17 +111,47 @@ TEST_QUERIES: List[Tuple[str, str, str]] = [
 ]
 
 
+# Substrings of a Cube error message that mean Cube is not reachable
+CUBE_UNAVAILABLE_MARKERS: Tuple[str, ...] = ("connect", "refused", "timeout")
+
+
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture(scope="session")
-def api_key_check():
-    """Verify API key is available."""
-    api_key = os.getenv("ANTHROPIC_API_KEY")
-    if not api_key:
-        pytest.skip("ANTHROPIC_API_KEY environment variable not set")
-    return api_key
+@pytest.fixture(scope="module")
+def run_pipeline(request, pytestconfig, orchestrator) -> Callable[[str], OrchestratorResponse]:
+    """
+    execute_query on the warmed-up orchestrator.
+    
+    With --extraction-workers N, the queries of every selected
+    test_full_pipeline case are run up front, N at a time, so their Claude
+    and Cube round-trips overlap; the tests then read the memoized responses.
+    Under pytest-xdist every worker sees the whole collection, so prefetching
+    is skipped there (-n already runs the cases concurrently).
+    """
+    workers = pytestconfig.getoption("--extraction-workers")
+    is_xdist_worker = hasattr(request.config, "workerinput")
+    if workers <= 1 or is_xdist_worker:
+        return orchestrator.execute_query
+    
+    run = functools.lru_cache(maxsize=None)(orchestrator.execute_query)
+    queries = set()
+    for item in request.session.items:
+        callspec = getattr(item, "callspec", None)
+        if item.module is request.module and callspec and "query" in callspec.params:
+            queries.add(callspec.params["query"])
+    
+    def prefetch(query: str) -> None:
+        try:
+            run(query)
+        except (Exception, pytest.skip.Exception):
+            pass  # Not memoized; the test itself re-raises (or skips) via run(query)
+    
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(prefetch, queries))
+    
+    return run
 
 
 # =============================================================================
@@ -140,7 +170,7 @@ class TestQueryOrchestratorE2E:
         TEST_QUERIES,
         ids=[q[2] for q in TEST_QUERIES]  # Use description as test ID
     )
-    def test_full_pipeline(self, api_key_check, query: str, expected_intent_type: str, description: str):
+    def test_full_pipeline(self, api_key_check, run_pipeline, query: str, expected_intent_type: str, description: str):
         """
         Test the complete pipeline from query to Cube execution.
         
@@ -158,7 +188,7 @@ class TestQueryOrchestratorE2E:
         print(f"Expected Intent Type: {expected_intent_type}")
         print(f"{'='*80}")
         
-        response = execute_query(query)
+        response = run_pipeline(query)
         
         # =====================================================================
         # STEP 1: Query received
@@ -236,9 +266,8 @@ class TestQueryOrchestratorE2E:
             print(f"  Message: {response.error.message[:100]}...")
             
             # Skip if Cube is unavailable (connection refused)
-            if "connect" in response.error.message.lower() or \
-               "refused" in response.error.message.lower() or \
-               "timeout" in response.error.message.lower():
+            message = response.error.message.lower()
+            if any(marker in message for marker in CUBE_UNAVAILABLE_MARKERS):
                 pytest.skip("Cube service unavailable - skipping execution test")
             
             # Other Cube errors should be reported but not fail the test
@@ -249,9 +278,10 @@ class TestQueryOrchestratorE2E:
         print(f"  Rows returned: {len(response.data)}")
         if response.data and len(response.data) > 0:
             print(f"  First row: {response.data[0]}")
-            with open("data.json", "a") as f:
-                json.dump(response.data, f, indent=4)
-            
+            # Full result sets can be large; only serialize them on request
+            # (pytest --log-cli-level=DEBUG)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response data: %s", json.dumps(response.data, indent=4))
         
         # =====================================================================
         # FINAL: Success
@@ -266,13 +296,15 @@ class TestQueryOrchestratorE2E:
         print(f"  Rows: {len(response.data)}")
         print(f"{'='*80}")
     
-    def test_response_structure(self, api_key_check):
+    def test_response_structure(self, api_key_check, orchestrator):
         """
         Test that the response has the expected structure for API serialization.
         Uses the first test query.
         """
         test_query = TEST_QUERIES[0][0]
-        response_dict = execute_query_dict(test_query)
+        # Outside --intent-mode live the extraction comes from the intent
+        # cache, so exercising the API helper costs no extra LLM call
+        response_dict = orchestrator.execute_query_dict(test_query)
         
         # Verify all expected keys are present
         expected_keys = [